@@ -0,0 +1,62 @@
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Database helpers shared by the test suites
+"""
+from sqlalchemy import text
+from sqlalchemy.orm import scoped_session, sessionmaker
+from service.models import db, Product
+
+
+def empty_product_table():
+    """Removes every Product, for tests that need to start from nothing"""
+    if db.engine.dialect.name == "postgresql":
+        db.session.execute(text("TRUNCATE TABLE product RESTART IDENTITY CASCADE"))
+    else:
+        db.session.query(Product).delete()
+
+
+class RollbackMixin:
+    """Runs every test of a TestCase in a transaction that is rolled back
+
+    One connection and session are shared by every test. The session joins
+    the transaction setUp() opens with a SAVEPOINT, so commit() only releases
+    the SAVEPOINT and tearDown() can throw all of the test data away.
+    """
+
+    @classmethod
+    def bind_shared_session(cls):
+        """Replaces db.session with one bound to a connection of the class"""
+        cls._session = db.session
+        cls._conn = db.engine.connect()
+        db.session = scoped_session(
+            sessionmaker(bind=cls._conn, join_transaction_mode="create_savepoint")
+        )
+
+    @classmethod
+    def unbind_shared_session(cls):
+        """Puts the Flask-SQLAlchemy session back and closes the connection"""
+        db.session.remove()
+        db.session = cls._session
+        cls._conn.close()
+
+    def setUp(self):
+        """Runs the test inside an outer transaction that is never committed"""
+        self._outer = self._conn.begin()
+
+    def tearDown(self):
+        """Throws away everything the test did"""
+        db.session.rollback()
+        self._outer.rollback()
@@ -37,3 +37,15 @@ class ProductFactory(factory.Factory):
     price=FuzzyDecimal( 0.5, 2000.0, 2)
     available=FuzzyChoice(choices=[True,False])
     category=FuzzyChoice(choices=[Category.UNKNOWN,Category.CLOTHS,Category.FOOD,Category.HOUSEWARES,Category.AUTOMOTIVE,Category.TOOLS])
+
+
+def product_attributes():
+    """Yields the attributes of new fake products, without an id
+
+    Each product is only built when it is needed, so a test module runs
+    Faker for exactly as many products as its tests save.
+    """
+    while True:
+        attributes = factory.build(dict, FACTORY_CLASS=ProductFactory)
+        del attributes["id"]  # let the database assign the primary key
+        yield attributes